@@ -0,0 +1,99 @@
+"""
+Compares file size, load time and save time of the plain and compressed
+storage formats.
+
+Usage:
+    python3 benchmarks/bench_storage.py [number_of_movies]
+"""
+import base64
+import hashlib
+import os
+import sys
+import tempfile
+import timeit
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from storage import StorageCsv  # noqa: E402
+from storage import StorageCsvCompressed  # noqa: E402
+from storage import StorageJson  # noqa: E402
+from storage import StorageJsonCompressed  # noqa: E402
+from storage.storage_compressed import POSTER_PREFIXES, zstd  # noqa: E402
+
+SAMPLE_FILE = os.path.join(BASE_DIR, "data", "movies.json")
+REPEAT = 5
+
+
+def build_movies(count):
+    """
+    Builds a catalogue of the given size from the sample data.
+
+    Args:
+        count (int): Number of movies to build.
+
+    Returns:
+        list: List of movie dictionaries.
+    """
+    sample = StorageJson(SAMPLE_FILE).load_movies()
+    movies = []
+    for index in range(count):
+        movie = sample[index % len(sample)]
+        # Poster ids are unique per movie, as in real OMDb data
+        poster_id = base64.b64encode(
+            hashlib.sha256(str(index).encode()).digest()).decode()
+        movies.append(dict(movie, title=f"{movie['title']} {index}",
+                           poster=f"{POSTER_PREFIXES[0]}MV5B{poster_id}"
+                                  f"@._V1_SX300.jpg"))
+    return movies
+
+
+def storages(directory):
+    """
+    Returns the storages to compare, keyed by label.
+
+    Args:
+        directory (str): Directory to write the benchmark files to.
+    """
+    variants = {
+        "json": StorageJson(os.path.join(directory, "movies.json")),
+        "json.gz": StorageJsonCompressed(
+            os.path.join(directory, "movies.json.gz")),
+        "json.gz posters": StorageJsonCompressed(
+            os.path.join(directory, "p_movies.json.gz"),
+            encode_posters=True),
+        "csv": StorageCsv(os.path.join(directory, "movies.csv")),
+        "csv.gz": StorageCsvCompressed(
+            os.path.join(directory, "movies.csv.gz")),
+        "csv.gz posters": StorageCsvCompressed(
+            os.path.join(directory, "p_movies.csv.gz"),
+            encode_posters=True),
+    }
+    if zstd is not None:
+        variants["json.zst"] = StorageJsonCompressed(
+            os.path.join(directory, "movies.json.zst"))
+        variants["csv.zst"] = StorageCsvCompressed(
+            os.path.join(directory, "movies.csv.zst"))
+    return variants
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    movies = build_movies(count)
+    print(f"{count} movies, best of {REPEAT} runs")
+    print(f"{'format':<18}{'size (KiB)':>12}{'save (ms)':>12}"
+          f"{'load (ms)':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for label, storage in storages(directory).items():
+            save = min(timeit.repeat(lambda: storage.save_movies(movies),
+                                     number=1, repeat=REPEAT))
+            load = min(timeit.repeat(storage.load_movies, number=1,
+                                     repeat=REPEAT))
+            assert storage.load_movies() == movies, label
+            size = os.path.getsize(storage.file_path) / 1024
+            print(f"{label:<18}{size:>12.1f}{save * 1000:>12.1f}"
+                  f"{load * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,16 @@
 from movie_app import MovieApp
 from storage import StorageCsv
+from storage import StorageCsvCompressed
 from storage import StorageJson
+from storage import StorageJsonCompressed
 import argparse
 import os
 
 
 def main():
     parser = argparse.ArgumentParser(description="movie file name")
-    parser.add_argument("file_name", help="movie file name csv or json")
+    parser.add_argument("file_name",
+                        help="movie file name csv or json (.gz/.zst allowed)")
     args = parser.parse_args()
     
     # Determine the directory of the current script
@@ -22,7 +25,11 @@ def main():
 
     storage = None
 
-    if "csv" in args.file_name:
+    if args.file_name.endswith((".csv.gz", ".csv.zst")):
+        storage = StorageCsvCompressed(file_path)
+    elif args.file_name.endswith((".json.gz", ".json.zst")):
+        storage = StorageJsonCompressed(file_path)
+    elif "csv" in args.file_name:
         storage = StorageCsv(file_path)
     elif "json" in args.file_name:
         storage = StorageJson(file_path)
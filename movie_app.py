@@ -133,7 +133,13 @@ class MovieApp:
             print("No movies found.")
             return
 
-        ratings = sorted([float(movie["rating"]) for movie in movies_list])
+        rated_movies = [movie for movie in movies_list
+                        if movie["rating"] is not None]
+        if not rated_movies:
+            print("No rated movies found.")
+            return
+
+        ratings = sorted(movie["rating"] for movie in rated_movies)
         length_ratings = len(ratings)
         best_rating = max(ratings)
         worst_rating = min(ratings)
@@ -142,10 +148,10 @@ class MovieApp:
 
         median = statistics.median(ratings)
 
-        best_titles = [movie["title"] + ", " + movie["rating"] for movie in
-                       movies_list if float(movie["rating"]) == best_rating]
-        worst_titles = [movie["title"] + ", " + movie["rating"] for movie in
-                        movies_list if float(movie["rating"]) == worst_rating]
+        best_titles = [f"{movie['title']}, {movie['rating']}" for movie in
+                       rated_movies if movie["rating"] == best_rating]
+        worst_titles = [f"{movie['title']}, {movie['rating']}" for movie in
+                        rated_movies if movie["rating"] == worst_rating]
 
         print(f"Average rating: {average:.1f}")
         print(f"Median rating:  {median:.1f}")
@@ -201,7 +207,7 @@ class MovieApp:
             return
         for movie in movies_list:
             title, year, rating, _ = movie.values()
-            print(f"{title} ({year}): {rating}")
+            print(f"{title} ({year}): {'N/A' if rating is None else rating}")
 
     def _print_random_movie(self):
         """
@@ -212,8 +218,9 @@ class MovieApp:
             print("No movies found.")
             return
         movie = random.choice(movies_list)
+        rating = "N/A" if movie["rating"] is None else movie["rating"]
         print(f"Your movie for tonight: {movie['title']}, it's rated "
-              f"{movie['rating']}")
+              f"{rating}")
 
     def _search_movie(self):
         """
@@ -241,7 +248,9 @@ class MovieApp:
         if not movies_list:
             print("No movies found.")
             return
-        sorted_movies = sorted(movies_list, key=lambda x: x["rating"],
+        sorted_movies = sorted(movies_list,
+                               key=lambda x: (x["rating"] is not None,
+                                              x["rating"] or 0),
                                reverse=True)
         self._print_movies(sorted_movies)
 
@@ -292,10 +301,13 @@ class MovieApp:
         end_year = int(
             input("Enter end year (leave blank for no end year): ") or 99999)
         movies_list = self._storage.load_movies()
+        if not movies_list:
+            print("No movies found.")
+            return
         filtered_movies = list(filter(
-            lambda movie: movie.get("rating") and float(
-                movie["rating"]) > minimum_rating and movie.get(
-                "year") and end_year >= int(movie["year"]) >= start_year,
+            lambda movie: movie["rating"] is not None and movie[
+                "rating"] > minimum_rating and end_year >= movie[
+                "year"] >= start_year,
             movies_list, ))
         if filtered_movies:
             self._print_movies(filtered_movies)
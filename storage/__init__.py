@@ -1,2 +1,3 @@
 from .storage_csv import *
 from .storage_json import *
+from .storage_compressed import *
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from .movie_schema import coerce_movie
+
 
 class IStorage(ABC):
     """
@@ -40,8 +42,14 @@ class IStorage(ABC):
                 return
 
         try:
-            movies_list.append({"title": title, "year": year, "rating": rating,
-                                "poster": poster, })
+            movie = coerce_movie({"title": title, "year": year,
+                                  "rating": rating, "poster": poster, })
+        except ValueError as e:
+            print(f"Error: Movie '{title}' has invalid data: {e}")
+            return
+
+        try:
+            movies_list.append(movie)
             self.save_movies(movies_list)
             print(f"Movie '{title}' successfully added")
         except Exception as e:
@@ -94,7 +102,11 @@ class IStorage(ABC):
 
         for movie in movies_list:
             if movie["title"].lower() == title.lower():
-                movie["rating"] = str(float(rating))
+                try:
+                    movie.update(coerce_movie(dict(movie, rating=rating)))
+                except ValueError as e:
+                    print(f"Error: Movie {title} was not updated: {e}")
+                    return
                 self.save_movies(movies_list)
                 print(f"Movie {title} successfully updated")
                 return
@@ -0,0 +1,269 @@
+import csv
+import json
+import math
+import os
+import re
+
+FIELDNAMES = ["title", "year", "rating", "poster"]
+
+# Marker OMDb uses for values it does not know (e.g. "imdbRating": "N/A")
+MISSING_VALUES = ("", "N/A")
+
+MIN_RATING = 0
+MAX_RATING = 10
+
+QUARANTINE_SUFFIX = ".rejected"
+
+# A year, or a series range such as "2005–2007" or "2005–" as OMDb reports it
+_YEAR = re.compile(r"\s*(\d{4})(?:\s*[–-]\s*(?:\d{4})?)?\s*$")
+
+_SEPARATORS = re.compile(r"[\s,]*")
+_RECORD_START = re.compile(r"\n[ \t]*\{")
+
+
+def coerce_movie(record):
+    """
+    Validates a raw movie record and converts it to its typed form.
+
+    Args:
+        record (dict): Raw movie record as read from the storage file.
+
+    Returns:
+        dict: Movie dictionary with title (str), year (int),
+        rating (float or None) and poster (str).
+
+    Raises:
+        ValueError: If the record cannot be converted.
+    """
+    if not isinstance(record, dict):
+        raise ValueError(f"expected an object, got {type(record).__name__}")
+    if None in record:
+        raise ValueError("row has more fields than the header")
+
+    title = record.get("title")
+    if not isinstance(title, str) or not title.strip():
+        raise ValueError("missing title")
+
+    year = _coerce_year(record.get("year"))
+    rating = _coerce_rating(record.get("rating"))
+
+    poster = record.get("poster")
+    if poster is None or poster in MISSING_VALUES:
+        poster = ""
+    elif not isinstance(poster, str):
+        raise ValueError(f"invalid poster: {poster!r}")
+
+    return {"title": title, "year": year, "rating": rating,
+            "poster": poster, }
+
+
+def _coerce_year(year):
+    """
+    Converts a raw year to an int.
+
+    Raises:
+        ValueError: If the year is not a whole number.
+    """
+    if isinstance(year, str):
+        match = _YEAR.match(year)
+        if match:
+            return int(match.group(1))
+    elif isinstance(year, int) and not isinstance(year, bool):
+        return year
+    elif isinstance(year, float) and year.is_integer():
+        return int(year)
+    raise ValueError(f"invalid year: {year!r}")
+
+
+def _coerce_rating(rating):
+    """
+    Converts a raw rating to a float, or None when it is missing.
+
+    Raises:
+        ValueError: If the rating is not a number between 0 and 10.
+    """
+    if rating is None or (isinstance(rating, str)
+                          and rating.strip() in MISSING_VALUES):
+        return None
+    if isinstance(rating, bool):
+        raise ValueError(f"invalid rating: {rating!r}")
+    try:
+        value = float(rating)
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid rating: {rating!r}") from None
+    if not math.isfinite(value) or not MIN_RATING <= value <= MAX_RATING:
+        raise ValueError(f"invalid rating: {rating!r}")
+    return value
+
+
+def load_json_records(file_path, text):
+    """
+    Loads the movies of a JSON storage file.
+
+    A well-formed file is decoded in one json.loads() call. Only when the
+    file is corrupt or holds invalid records is it parsed again record by
+    record, so that the bad ones can be quarantined with their line number.
+
+    Args:
+        file_path (str): Path to the storage file the text comes from.
+        text (str): Content of the JSON storage file.
+
+    Returns:
+        list: List of typed movie dictionaries.
+    """
+    try:
+        records = json.loads(text)
+        if isinstance(records, list):
+            return [coerce_movie(record) for record in records]
+    except ValueError:
+        # json.JSONDecodeError is a ValueError as well
+        pass
+    return load_records(file_path, iter_json_records(text))
+
+
+def iter_json_records(text):
+    """
+    Parses a JSON array of movie records one element at a time.
+
+    A corrupt element does not abort the parse: it is reported and the
+    parser resumes at the next line that starts with "{", which is where
+    every record begins in the files written by the storages.
+
+    Args:
+        text (str): Content of the JSON storage file.
+
+    Yields:
+        tuple: (line number, record, error). error is None for a parsed
+        record; otherwise record holds the raw text that was skipped.
+    """
+    decoder = json.JSONDecoder()
+    length = len(text)
+    pos = text.find("[")
+    if pos == -1:
+        pos = text.find("{")
+        if pos == -1:
+            if text.strip():
+                yield 1, text.strip(), "no JSON array found"
+            return
+    else:
+        pos += 1
+
+    line = text.count("\n", 0, pos) + 1
+    while True:
+        # Skip the separators between array elements
+        end = _SEPARATORS.match(text, pos).end()
+        line += text.count("\n", pos, end)
+        pos = end
+        if pos >= length or text[pos] == "]":
+            return
+
+        try:
+            record, end = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError as e:
+            next_record = _RECORD_START.search(text, pos + 1)
+            end = next_record.end() - 1 if next_record else length
+            yield line, text[pos:end].strip(), e.msg
+        else:
+            yield line, record, None
+        line += text.count("\n", pos, end)
+        pos = end
+
+
+def iter_csv_records(csvfile):
+    """
+    Reads the rows of a CSV storage file, reporting unreadable rows instead
+    of stopping at them.
+
+    Args:
+        csvfile (iterable): Lines of the CSV storage file.
+
+    Yields:
+        tuple: (line number the row starts on, record, error). error is
+        None for a parsed row; otherwise record holds the raw text of the
+        row.
+    """
+    lines = []
+
+    def recorded_lines():
+        for text_line in csvfile:
+            lines.append(text_line)
+            yield text_line
+
+    reader = csv.DictReader(recorded_lines())
+    if reader.fieldnames is None:
+        return
+    line = len(lines) + 1
+    while True:
+        lines.clear()
+        try:
+            record = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            yield line, "".join(lines), str(e)
+        else:
+            yield line, record, None
+        line += len(lines)
+
+
+def load_records(file_path, records):
+    """
+    Coerces parsed records in a single pass, quarantining the invalid ones.
+
+    Invalid records are appended, one JSON object per line together with
+    their line number and the reason, to the file_path + ".rejected" side
+    file. Entries already present in the side file are not written again,
+    so the file keeps rows that a later save drops from the storage file.
+
+    Args:
+        file_path (str): Path to the storage file the records come from.
+        records (iterable): (line number, record, error) tuples.
+
+    Returns:
+        list: List of typed movie dictionaries.
+    """
+    movies = []
+    rejected = []
+    for line, record, error in records:
+        if error is None:
+            try:
+                movies.append(coerce_movie(record))
+                continue
+            except ValueError as e:
+                error = str(e)
+        rejected.append(json.dumps({"line": line, "error": error,
+                                    "record": record, }))
+
+    if rejected:
+        _quarantine(file_path + QUARANTINE_SUFFIX, rejected)
+
+    return movies
+
+
+def _quarantine(quarantine_path, rejected):
+    """
+    Appends rejected entries to the side file, skipping known ones.
+
+    A warning is printed only when new entries are written, not on every
+    load of a file whose bad records are already quarantined.
+
+    Args:
+        quarantine_path (str): Path to the side file.
+        rejected (list): Serialized rejected entries.
+    """
+    try:
+        known = set()
+        if os.path.exists(quarantine_path):
+            with open(quarantine_path, "r", encoding="utf-8") as handle:
+                known = set(handle.read().splitlines())
+        new_entries = [entry for entry in rejected if entry not in known]
+        if not new_entries:
+            return
+        with open(quarantine_path, "a", encoding="utf-8") as handle:
+            handle.write("\n".join(new_entries) + "\n")
+    except OSError as e:
+        print(f"Warning: {len(rejected)} invalid movie record(s) skipped, "
+              f"could not write {quarantine_path}: {e}")
+        return
+    print(f"Warning: {len(new_entries)} invalid movie record(s) skipped, "
+          f"see {quarantine_path}")
@@ -0,0 +1,294 @@
+import codecs
+import gzip
+import json
+
+from .storage_csv import StorageCsv
+from .storage_json import StorageJson
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+GZIP_LEVEL = 6
+READ_CHUNK_SIZE = 64 * 1024
+
+# Errors raised for a corrupt or unreadable compressed file
+DECOMPRESSION_ERRORS = (OSError, EOFError, ValueError)
+if zstd is not None:
+    DECOMPRESSION_ERRORS += (zstd.ZstdError, )
+
+# Poster URLs returned by OMDb share these prefixes; they are stored as
+# "@<index>:" followed by the rest of the URL. A poster that itself starts
+# with "@" is stored with the "@" doubled.
+POSTER_PREFIXES = ("https://m.media-amazon.com/images/M/",
+                   "https://ia.media-imdb.com/images/M/", )
+
+
+def open_compressed(file_path, mode, newline=None):
+    """
+    Opens a gzip (.gz) or zstd (.zst) compressed file.
+
+    The data is (de)compressed in chunks while it is read or written.
+
+    Args:
+        file_path (str): Path to the compressed file.
+        mode (str): "r" or "w" for text, "rb" to read the raw bytes.
+        newline (str): Passed on to the text wrapper.
+
+    Returns:
+        file object: The opened file.
+    """
+    if mode.endswith("b"):
+        options = {}
+    else:
+        mode += "t"
+        options = {"encoding": "utf-8", "newline": newline}
+    if file_path.endswith(".zst"):
+        if zstd is None:
+            raise ValueError("zstd files need Python 3.14 or the "
+                             "'zstandard' package")
+        return zstd.open(file_path, mode, **options)
+    return gzip.open(file_path, mode, compresslevel=GZIP_LEVEL, **options)
+
+
+class CompressedReader:
+    """
+    Reads the text of a compressed file, tolerating a truncated stream.
+
+    When the file ends before the end of the compressed stream, the text
+    decompressed so far is kept up to its last complete line, so the
+    records before the cut still load.
+
+    Attributes:
+        file_path (str): The path to the compressed file.
+    """
+
+    def __init__(self, file_path):
+        """
+        Opens the compressed file.
+
+        Args:
+            file_path (str): Path to the compressed file.
+        """
+        self.file_path = file_path
+        self._handle = open_compressed(file_path, "rb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._handle.close()
+
+    def _chunks(self):
+        """
+        Yields the decompressed text in chunks, ending at the last complete
+        line when the stream is truncated.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        pending = ""
+        while True:
+            try:
+                data = self._handle.read1(READ_CHUNK_SIZE)
+            except EOFError as e:
+                print(f"Warning: {self.file_path} is truncated ({e}), "
+                      f"only the complete records are loaded")
+                yield pending[:pending.rfind("\n") + 1]
+                return
+            if not data:
+                yield pending + decoder.decode(b"", final=True)
+                return
+            text = pending + decoder.decode(data)
+            cut = text.rfind("\n") + 1
+            pending = text[cut:]
+            yield text[:cut]
+
+    def read(self):
+        """
+        Returns the whole decompressed text.
+        """
+        return "".join(self._chunks())
+
+    def __iter__(self):
+        """
+        Yields the decompressed text line by line.
+        """
+        for chunk in self._chunks():
+            lines = chunk.split("\n")
+            for line in lines[:-1]:
+                yield line + "\n"
+            # Only the last chunk can end without a newline
+            if lines[-1]:
+                yield lines[-1]
+
+
+def encode_poster(poster):
+    """
+    Replaces a known poster URL prefix with its short reference.
+
+    Args:
+        poster (str): URL of the movie poster.
+
+    Returns:
+        str: The encoded poster.
+    """
+    if poster.startswith("@"):
+        return "@" + poster
+    for index, prefix in enumerate(POSTER_PREFIXES):
+        if poster.startswith(prefix):
+            return f"@{index}:{poster[len(prefix):]}"
+    return poster
+
+
+def decode_poster(poster):
+    """
+    Expands a poster encoded by encode_poster() back to its URL.
+
+    Args:
+        poster (str): The encoded poster.
+
+    Returns:
+        str: URL of the movie poster.
+    """
+    if poster.startswith("@@"):
+        return poster[1:]
+    if poster.startswith("@"):
+        index, separator, rest = poster[1:].partition(":")
+        if separator and index.isdigit() and int(index) < len(
+                POSTER_PREFIXES):
+            return POSTER_PREFIXES[int(index)] + rest
+    return poster
+
+
+class StorageJsonCompressed(StorageJson):
+    """
+    A class for managing movie data stored in a compressed JSON file
+    (.json.gz, or .json.zst when zstd is available).
+
+    Movies are written compactly, one record per line, so line numbers in
+    the quarantine file still point at the corrupt record.
+
+    Attributes:
+        file_path (str): The path to the compressed JSON file.
+        encode_posters (bool): Whether the file stores common poster URL
+            prefixes as short references. Off by default, so the file
+            stays plain JSON for other tools.
+    """
+
+    def __init__(self, file_path, encode_posters=False):
+        """
+        Initializes the StorageJsonCompressed instance.
+
+        Args:
+            file_path (str): Path to the compressed JSON file.
+            encode_posters (bool): Read and write common poster URL
+                prefixes as short references.
+        """
+        super().__init__(file_path)
+        self.encode_posters = encode_posters
+
+    def _open(self, mode):
+        if mode == "r":
+            return CompressedReader(self.file_path)
+        return open_compressed(self.file_path, mode)
+
+    def load_movies(self):
+        """
+        Loads movie data from the compressed JSON file.
+
+        Returns:
+            list: List of movie dictionaries.
+        """
+        try:
+            movies = super().load_movies()
+        except DECOMPRESSION_ERRORS as e:
+            print(f"Error: Could not decompress {self.file_path}: {e}")
+            return
+        if movies and self.encode_posters:
+            for movie in movies:
+                movie["poster"] = decode_poster(movie["poster"])
+        return movies
+
+    def save_movies(self, movies):
+        """
+        Saves the updated movie data to the compressed JSON file.
+
+        Args:
+            movies (list): List of movie dictionaries.
+        """
+        try:
+            with self._open("w") as movie_obj:
+                movie_obj.write("[\n")
+                for index, movie in enumerate(movies):
+                    if self.encode_posters:
+                        movie = dict(movie,
+                                     poster=encode_poster(movie["poster"]))
+                    if index:
+                        movie_obj.write(",\n")
+                    movie_obj.write(json.dumps(movie, separators=(",", ":")))
+                movie_obj.write("\n]\n")
+        except FileNotFoundError:
+            print("Error: File was not found.")
+            return
+
+
+class StorageCsvCompressed(StorageCsv):
+    """
+    A class for managing movie data stored in a compressed CSV file
+    (.csv.gz, or .csv.zst when zstd is available).
+
+    Attributes:
+        file_path (str): The path to the compressed CSV file.
+        encode_posters (bool): Whether the file stores common poster URL
+            prefixes as short references. Off by default, so the file
+            stays plain CSV for other tools.
+    """
+
+    def __init__(self, file_path, encode_posters=False):
+        """
+        Initializes the StorageCsvCompressed instance.
+
+        Args:
+            file_path (str): Path to the compressed CSV file.
+            encode_posters (bool): Read and write common poster URL
+                prefixes as short references.
+        """
+        super().__init__(file_path)
+        self.encode_posters = encode_posters
+
+    def _open(self, mode):
+        if mode == "r":
+            return CompressedReader(self.file_path)
+        return open_compressed(self.file_path, mode, newline="")
+
+    def load_movies(self):
+        """
+        Loads movie data from the compressed CSV file.
+
+        Returns:
+            list: List of movie dictionaries.
+        """
+        try:
+            movies = super().load_movies()
+        except DECOMPRESSION_ERRORS as e:
+            print(f"Error: Could not decompress {self.file_path}: {e}")
+            return
+        if movies and self.encode_posters:
+            for movie in movies:
+                movie["poster"] = decode_poster(movie["poster"])
+        return movies
+
+    def save_movies(self, movies):
+        """
+        Saves the updated movie data to the compressed CSV file.
+
+        Args:
+            movies (list): List of movie dictionaries.
+        """
+        if self.encode_posters:
+            movies = (dict(movie, poster=encode_poster(movie["poster"]))
+                      for movie in movies)
+        super().save_movies(movies)
@@ -1,4 +1,5 @@
 from .istorage import IStorage
+from .movie_schema import FIELDNAMES, iter_csv_records, load_records
 import csv
 
 
@@ -27,18 +28,32 @@ class StorageCsv(IStorage):
         """
         super().__init__(file_path)
 
+    def _open(self, mode):
+        """
+        Opens the CSV file in text mode.
+
+        Args:
+            mode (str): "r" to read or "w" to write.
+
+        Returns:
+            file object: The opened file.
+        """
+        return open(self.file_path, mode, encoding="utf-8", newline="")
+
     def load_movies(self):
         """
         Loads movie data from the JSON file and returns it as a list of
         dictionaries.
 
+        Year and rating are converted once here. Invalid rows are skipped
+        and written to the quarantine side file.
+
         Returns:
             list: List of movie dictionaries.
         """
         try:
-            with open(self.file_path, "r", encoding="utf-8", newline="") as csvfile:
-                reader = csv.DictReader(csvfile)
-                return list(reader)
+            with self._open("r") as csvfile:
+                return load_records(self.file_path, iter_csv_records(csvfile))
         except FileNotFoundError:
             print(f"Error: The storage file was not found.: {self.file_path}")
 
@@ -50,9 +65,8 @@ class StorageCsv(IStorage):
             movies (list): List of movie dictionaries.
         """
         try:
-            with open(self.file_path, "w", encoding="utf-8", newline="") as csvfile:
-                fieldnames = ["title", "year", "rating", "poster"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            with self._open("w") as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
                 writer.writeheader()
                 for movie in movies:
                     writer.writerow(movie)
@@ -1,6 +1,7 @@
 import json
 
 from .istorage import IStorage
+from .movie_schema import load_json_records
 
 
 class StorageJson(IStorage):
@@ -28,22 +29,37 @@ class StorageJson(IStorage):
         """
         super().__init__(file_path)
 
+    def _open(self, mode):
+        """
+        Opens the JSON file in text mode.
+
+        Args:
+            mode (str): "r" to read or "w" to write.
+
+        Returns:
+            file object: The opened file.
+        """
+        return open(self.file_path, mode, encoding="utf-8")
+
     def load_movies(self):
         """
         Loads movie data from the JSON file and returns it as a list of
         dictionaries.
 
+        Year and rating are converted once here. Corrupt or invalid records
+        are skipped and written to the quarantine side file, the remaining
+        records are still returned.
+
         Returns:
             list: List of movie dictionaries.
         """
         try:
-            with open(self.file_path, "r", encoding="utf-8") as movie_obj:
-                return json.load(movie_obj)
+            with self._open("r") as movie_obj:
+                text = movie_obj.read()
         except FileNotFoundError:
             print("Error: The storage file was not found.")
-        except json.JSONDecodeError as e:
-            print(f"Error: An error occurred while parsing the JSON data: {e}")
             return
+        return load_json_records(self.file_path, text)
 
     def save_movies(self, movies):
         """
@@ -53,7 +69,7 @@ class StorageJson(IStorage):
             movies (list): List of movie dictionaries.
         """
         try:
-            with open(self.file_path, "w", encoding="utf-8") as movie_obj:
+            with self._open("w") as movie_obj:
                 json.dump(movies, movie_obj, indent=4)
         except FileNotFoundError:
             print("Error: File was not found.")
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from storage.movie_schema import (QUARANTINE_SUFFIX, coerce_movie,
+                                  iter_csv_records, iter_json_records,
+                                  load_json_records, load_records)
+
+GOOD = {"title": "Avatar", "year": "2009", "rating": "7.9", "poster": "p"}
+
+
+def pretty(records):
+    """
+    Returns records formatted the way StorageJson writes them.
+    """
+    return json.dumps(records, indent=4)
+
+
+def read_quarantine(file_path):
+    with open(file_path + QUARANTINE_SUFFIX, encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def test_coerce_movie_converts_types():
+    assert coerce_movie(GOOD) == {"title": "Avatar", "year": 2009,
+                                  "rating": 7.9, "poster": "p"}
+
+
+@pytest.mark.parametrize("rating", ["N/A", "", None])
+def test_coerce_movie_missing_rating_is_none(rating):
+    assert coerce_movie(dict(GOOD, rating=rating))["rating"] is None
+
+
+@pytest.mark.parametrize("year", ["2005–2007", "2005-2007", "2005–", 2005,
+                                  2005.0])
+def test_coerce_movie_year_ranges_and_numbers(year):
+    assert coerce_movie(dict(GOOD, year=year))["year"] == 2005
+
+
+@pytest.mark.parametrize("field, value", [
+    ("rating", "nan"), ("rating", "inf"), ("rating", "1e400"),
+    ("rating", "11"), ("rating", "-0.5"), ("rating", True),
+    ("rating", "good"), ("year", True), ("year", 2000.7), ("year", "20x3"),
+    ("year", "20051"), ("year", None), ("poster", 5), ("title", ""),
+])
+def test_coerce_movie_rejects_invalid_values(field, value):
+    with pytest.raises(ValueError):
+        coerce_movie(dict(GOOD, **{field: value}))
+
+
+def test_corrupt_middle_record_is_skipped():
+    text = pretty([GOOD, {"title": "Broken"}, dict(GOOD, title="Titanic")])
+    text = text.replace('"title": "Broken"', '"title": "Broken" "year"')
+
+    records = list(iter_json_records(text))
+
+    assert [error is None for _, _, error in records] == [True, False, True]
+    line, raw, _ = records[1]
+    assert line == 8
+    assert '"Broken"' in raw
+    assert records[2][1]["title"] == "Titanic"
+
+
+def test_braces_inside_corrupt_record_do_not_split_it():
+    text = ('[\n'
+            '    {"title": "A {x}", "m": {"x": 1}, "year": 1 2},\n'
+            '    {"title": "B", "year": "2001"}\n'
+            ']')
+
+    records = list(iter_json_records(text))
+
+    assert len(records) == 2
+    assert records[0][2] is not None
+    assert records[1] == (3, {"title": "B", "year": "2001"}, None)
+
+
+def test_truncated_array_keeps_complete_records(tmp_path):
+    file_path = str(tmp_path / "movies.json")
+    text = pretty([GOOD, dict(GOOD, title="Titanic")])
+    text = text[:text.rindex('"poster"')]
+
+    movies = load_json_records(file_path, text)
+
+    assert [movie["title"] for movie in movies] == ["Avatar"]
+    [entry] = read_quarantine(file_path)
+    assert entry["line"] == 8
+    assert '"Titanic"' in entry["record"]
+
+
+def test_invalid_records_are_quarantined_once(tmp_path, capsys):
+    file_path = str(tmp_path / "movies.json")
+    text = pretty([GOOD, dict(GOOD, rating="nan")])
+
+    for _ in range(2):
+        movies = load_json_records(file_path, text)
+
+    assert len(movies) == 1
+    assert read_quarantine(file_path) == [
+        {"line": 8, "error": "invalid rating: 'nan'",
+         "record": dict(GOOD, rating="nan")}]
+    assert capsys.readouterr().out.count("Warning") == 1
+
+
+def test_unreadable_csv_row_keeps_raw_text(tmp_path):
+    file_path = str(tmp_path / "movies.csv")
+    long_row = "Big,2001,2," + "x" * 200000 + "\n"
+    lines = ["title,year,rating,poster\n", "Avatar,2009,7.9,p\n", long_row,
+             "Titanic,1997,N/A,p\n"]
+
+    movies = load_records(file_path, iter_csv_records(lines))
+
+    assert [movie["title"] for movie in movies] == ["Avatar", "Titanic"]
+    assert movies[1]["rating"] is None
+    [entry] = read_quarantine(file_path)
+    assert entry["line"] == 3
+    assert entry["record"] == long_row
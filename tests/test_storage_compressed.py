@@ -0,0 +1,49 @@
+import gzip
+
+import pytest
+
+from storage import StorageCsvCompressed, StorageJsonCompressed
+from storage.storage_compressed import decode_poster, encode_poster
+
+PREFIX = "https://m.media-amazon.com/images/M/"
+
+
+def build_movies(count):
+    return [{"title": f"Movie {index}", "year": 2000, "rating": 7.5,
+             "poster": f"{PREFIX}{'x' * 60}{index}.jpg"}
+            for index in range(count)]
+
+
+@pytest.mark.parametrize("storage_class, name", [
+    (StorageJsonCompressed, "movies.json.gz"),
+    (StorageCsvCompressed, "movies.csv.gz"),
+])
+def test_truncated_file_keeps_complete_records(tmp_path, storage_class,
+                                               name):
+    file_path = str(tmp_path / name)
+    movies = build_movies(5000)
+    storage = storage_class(file_path)
+    storage.save_movies(movies)
+    with open(file_path, "rb") as handle:
+        data = handle.read()
+    with open(file_path, "wb") as handle:
+        handle.write(data[:len(data) // 2])
+
+    loaded = storage.load_movies()
+
+    assert 0 < len(loaded) < len(movies)
+    assert loaded == movies[:len(loaded)]
+
+
+@pytest.mark.parametrize("poster", ["@0:foo", "@@x", PREFIX + "a.jpg", ""])
+def test_poster_encoding_round_trips(poster):
+    assert decode_poster(encode_poster(poster)) == poster
+
+
+def test_posters_are_plain_by_default(tmp_path):
+    file_path = str(tmp_path / "movies.json.gz")
+    with gzip.open(file_path, "wt", encoding="utf-8") as handle:
+        handle.write('[{"title": "A", "year": 2000, "poster": "@0:foo"}]')
+
+    assert StorageJsonCompressed(file_path).load_movies()[0][
+               "poster"] == "@0:foo"